@@ -6,12 +6,84 @@ para documentar y probar toda la API del Component Store.
 """
 
 import json
-import uuid
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Codificadores stdlib reutilizables; check_circular=False es seguro porque
+# el árbol se construye solo con literales
+_JSON_ENCODER_INDENT = json.JSONEncoder(
+    ensure_ascii=False, indent=2, check_circular=False, separators=(',', ': '))
+_JSON_ENCODER_COMPACT = json.JSONEncoder(
+    ensure_ascii=False, check_circular=False, separators=(',', ':'))
+
+def _dumps(obj, indent=False):
+    """Serializa un objeto a JSON usando orjson si está disponible"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    encoder = _JSON_ENCODER_INDENT if indent else _JSON_ENCODER_COMPACT
+    return encoder.encode(obj)
+
+def _dump_bytes(obj, indent=False):
+    """Serializa un objeto a JSON como bytes UTF-8 listos para escribir"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option)
+    return _dumps(obj, indent=indent).encode('utf-8')
+
+# Cuerpos de request constantes, serializados una sola vez al importar
+_REGISTER_BODY = _dumps({
+    "email": "user@example.com",
+    "pass": "password123"
+}, indent=True)
+
+_LOGIN_BODY = _dumps({
+    "email": "user@example.com",
+    "pass": "password123"
+}, indent=True)
+
+_CREATE_COMPONENT_BODY = _dumps({
+    "id": "custom-button-1",
+    "name": "Animated Button",
+    "type": "button",
+    "jsxCode": "const AnimatedButton = ({ children, onClick }) => {\n  return (\n    <button\n      className=\"animated-btn\"\n      onClick={onClick}\n    >\n      {children}\n    </button>\n  );\n};\n\nexport default AnimatedButton;",
+    "animationCode": ".animated-btn {\n  background: linear-gradient(45deg, #667eea, #764ba2);\n  border: none;\n  padding: 12px 24px;\n  border-radius: 8px;\n  color: white;\n  cursor: pointer;\n  transition: all 0.3s ease;\n}\n\n.animated-btn:hover {\n  transform: translateY(-2px);\n  box-shadow: 0 4px 20px rgba(0,0,0,0.3);\n}"
+}, indent=True)
+
+_DONATION_BODY = _dumps({
+    "amount": 25.50,
+    "componentId": "custom-button-1",
+    "isPremiumUpgrade": False
+}, indent=True)
+
+_PREMIUM_BODY = _dumps({
+    "amount": 50.00,
+    "isPremiumUpgrade": True
+}, indent=True)
+
+@lru_cache(maxsize=None)
+def _url(*parts):
+    """Construye (y memoriza) el dict de URL de Postman para una ruta"""
+    return {
+        "raw": "{{base_url}}/" + "/".join(parts),
+        "host": ["{{base_url}}"],
+        "path": list(parts)
+    }
+
 def generate_uuid():
-    """Genera un UUID único para Postman"""
-    return str(uuid.uuid4())
+    """Genera un UUID v4 único para Postman sin pasar por uuid.UUID"""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # versión 4
+    b[8] = (b[8] & 0x3F) | 0x80  # variante RFC 4122
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 def create_postman_collection():
     """Crea la estructura base de la colección de Postman"""
@@ -58,447 +130,380 @@ def create_postman_collection():
     
     return collection
 
+_AUTH_FOLDER = {
+    "name": "🔐 Authentication",
+    "item": [
+        {
+            "name": "Register User",
+            "request": {
+                "method": "POST",
+                "header": [
+                    {
+                        "key": "Content-Type",
+                        "value": "application/json"
+                    }
+                ],
+                "body": {
+                    "mode": "raw",
+                    "raw": _REGISTER_BODY
+                },
+                "url": _url("api", "users", "register"),
+                "description": "Registra un nuevo usuario en el sistema"
+            },
+            "response": [],
+            "event": [
+                {
+                    "listen": "test",
+                    "script": {
+                        "exec": [
+                            "if (pm.response.code === 200) {",
+                            "    const response = pm.response.json();",
+                            "    pm.test('User registered successfully', function() {",
+                            "        pm.expect(response).to.have.property('id');",
+                            "        pm.expect(response).to.have.property('email');",
+                            "    });",
+                            "}"
+                        ]
+                    }
+                }
+            ]
+        },
+        {
+            "name": "Login User",
+            "request": {
+                "method": "POST",
+                "header": [
+                    {
+                        "key": "Content-Type",
+                        "value": "application/json"
+                    }
+                ],
+                "body": {
+                    "mode": "raw",
+                    "raw": _LOGIN_BODY
+                },
+                "url": _url("api", "users", "login"),
+                "description": "Autentica un usuario y obtiene el token JWT"
+            },
+            "response": [],
+            "event": [
+                {
+                    "listen": "test",
+                    "script": {
+                        "exec": [
+                            "if (pm.response.code === 200) {",
+                            "    const response = pm.response.json();",
+                            "    pm.test('Login successful', function() {",
+                            "        pm.expect(response).to.have.property('token');",
+                            "    });",
+                            "    // Guardar token para otras requests",
+                            "    pm.collectionVariables.set('auth_token', response.token);",
+                            "}"
+                        ]
+                    }
+                }
+            ]
+        }
+    ]
+}
+
 def create_auth_folder():
     """Crea la carpeta de autenticación"""
-    return {
-        "name": "🔐 Authentication",
-        "item": [
-            {
-                "name": "Register User",
-                "request": {
-                    "method": "POST",
-                    "header": [
+    return _AUTH_FOLDER
+
+_COMPONENTS_FOLDER = {
+    "name": "🧩 Components",
+    "item": [
+        {
+            "name": "Get All Components",
+            "request": {
+                "method": "GET",
+                "header": [],
+                "url": _url("api", "components"),
+                "description": "Obtiene la lista de todos los componentes disponibles"
+            },
+            "response": []
+        },
+        {
+            "name": "Get Components by Type",
+            "request": {
+                "method": "GET",
+                "header": [],
+                "url": {
+                    "raw": "{{base_url}}/api/components?type=button",
+                    "host": ["{{base_url}}"],
+                    "path": ["api", "components"],
+                    "query": [
                         {
-                            "key": "Content-Type",
-                            "value": "application/json"
+                            "key": "type",
+                            "value": "button",
+                            "description": "Filtrar por tipo: button, card, modal, navigation, form, layout, animation, other"
                         }
-                    ],
-                    "body": {
-                        "mode": "raw",
-                        "raw": json.dumps({
-                            "email": "user@example.com",
-                            "pass": "password123"
-                        }, indent=2)
-                    },
-                    "url": {
-                        "raw": "{{base_url}}/api/users/register",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "users", "register"]
+                    ]
+                },
+                "description": "Filtra componentes por tipo específico"
+            },
+            "response": []
+        },
+        {
+            "name": "Get Components by Type (Path)",
+            "request": {
+                "method": "GET",
+                "header": [],
+                "url": _url("api", "components", "type", "button"),
+                "description": "Obtiene componentes de un tipo específico usando parámetro de ruta"
+            },
+            "response": []
+        },
+        {
+            "name": "Create Component",
+            "request": {
+                "auth": {
+                    "type": "noauth"
+                },
+                "method": "POST",
+                "header": [
+                    {
+                        "key": "Content-Type",
+                        "value": "application/json"
                     },
-                    "description": "Registra un nuevo usuario en el sistema"
+                    {
+                        "key": "token",
+                        "value": "{{auth_token}}"
+                    }
+                ],
+                "body": {
+                    "mode": "raw",
+                    "raw": _CREATE_COMPONENT_BODY
                 },
-                "response": [],
-                "event": [
+                "url": _url("api", "components"),
+                "description": "Crea un nuevo componente (requiere autenticación)"
+            },
+            "response": []
+        },
+        {
+            "name": "Get Specific Component",
+            "request": {
+                "auth": {
+                    "type": "noauth"
+                },
+                "method": "GET",
+                "header": [
                     {
-                        "listen": "test",
-                        "script": {
-                            "exec": [
-                                "if (pm.response.code === 200) {",
-                                "    const response = pm.response.json();",
-                                "    pm.test('User registered successfully', function() {",
-                                "        pm.expect(response).to.have.property('id');",
-                                "        pm.expect(response).to.have.property('email');",
-                                "    });",
-                                "}"
-                            ]
-                        }
+                        "key": "token",
+                        "value": "{{auth_token}}"
                     }
-                ]
+                ],
+                "url": _url("api", "components", "custom-button-1"),
+                "description": "Obtiene detalles completos de un componente específico (requiere autenticación y posible pago)"
             },
-            {
-                "name": "Login User",
-                "request": {
-                    "method": "POST",
-                    "header": [
-                        {
-                            "key": "Content-Type",
-                            "value": "application/json"
-                        }
-                    ],
-                    "body": {
-                        "mode": "raw",
-                        "raw": json.dumps({
-                            "email": "user@example.com",
-                            "pass": "password123"
-                        }, indent=2)
-                    },
-                    "url": {
-                        "raw": "{{base_url}}/api/users/login",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "users", "login"]
-                    },
-                    "description": "Autentica un usuario y obtiene el token JWT"
+            "response": []
+        },
+        {
+            "name": "Get User Access Info",
+            "request": {
+                "auth": {
+                    "type": "noauth"
                 },
-                "response": [],
-                "event": [
+                "method": "GET",
+                "header": [
                     {
-                        "listen": "test",
-                        "script": {
-                            "exec": [
-                                "if (pm.response.code === 200) {",
-                                "    const response = pm.response.json();",
-                                "    pm.test('Login successful', function() {",
-                                "        pm.expect(response).to.have.property('token');",
-                                "    });",
-                                "    // Guardar token para otras requests",
-                                "    pm.collectionVariables.set('auth_token', response.token);",
-                                "}"
-                            ]
-                        }
+                        "key": "token",
+                        "value": "{{auth_token}}"
                     }
-                ]
-            }
-        ]
-    }
+                ],
+                "url": _url("api", "components", "user", "access-info"),
+                "description": "Obtiene información sobre el acceso del usuario a componentes"
+            },
+            "response": []
+        }
+    ]
+}
 
 def create_components_folder():
     """Crea la carpeta de componentes"""
-    return {
-        "name": "🧩 Components",
-        "item": [
-            {
-                "name": "Get All Components",
-                "request": {
-                    "method": "GET",
-                    "header": [],
-                    "url": {
-                        "raw": "{{base_url}}/api/components",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "components"]
-                    },
-                    "description": "Obtiene la lista de todos los componentes disponibles"
-                },
-                "response": []
+    return _COMPONENTS_FOLDER
+
+_PAYMENTS_FOLDER = {
+    "name": "💳 Payments",
+    "item": [
+        {
+            "name": "Get Pricing Info",
+            "request": {
+                "method": "GET",
+                "header": [],
+                "url": _url("api", "payment", "pricing-info"),
+                "description": "Obtiene información de precios y beneficios premium"
             },
-            {
-                "name": "Get Components by Type",
-                "request": {
-                    "method": "GET",
-                    "header": [],
-                    "url": {
-                        "raw": "{{base_url}}/api/components?type=button",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "components"],
-                        "query": [
-                            {
-                                "key": "type",
-                                "value": "button",
-                                "description": "Filtrar por tipo: button, card, modal, navigation, form, layout, animation, other"
-                            }
-                        ]
-                    },
-                    "description": "Filtra componentes por tipo específico"
+            "response": []
+        },
+        {
+            "name": "Create Component Donation Order",
+            "request": {
+                "auth": {
+                    "type": "noauth"
                 },
-                "response": []
-            },
-            {
-                "name": "Get Components by Type (Path)",
-                "request": {
-                    "method": "GET",
-                    "header": [],
-                    "url": {
-                        "raw": "{{base_url}}/api/components/type/button",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "components", "type", "button"]
+                "method": "POST",
+                "header": [
+                    {
+                        "key": "Content-Type",
+                        "value": "application/json"
                     },
-                    "description": "Obtiene componentes de un tipo específico usando parámetro de ruta"
+                    {
+                        "key": "token",
+                        "value": "{{auth_token}}"
+                    }
+                ],
+                "body": {
+                    "mode": "raw",
+                    "raw": _DONATION_BODY
                 },
-                "response": []
+                "url": _url("api", "payment", "create-order"),
+                "description": "Crea una orden de PayPal para donar por un componente específico"
             },
-            {
-                "name": "Create Component",
-                "request": {
-                    "auth": {
-                        "type": "noauth"
-                    },
-                    "method": "POST",
-                    "header": [
-                        {
-                            "key": "Content-Type",
-                            "value": "application/json"
-                        },
-                        {
-                            "key": "token",
-                            "value": "{{auth_token}}"
-                        }
-                    ],
-                    "body": {
-                        "mode": "raw",
-                        "raw": json.dumps({
-                            "id": "custom-button-1",
-                            "name": "Animated Button",
-                            "type": "button",
-                            "jsxCode": "const AnimatedButton = ({ children, onClick }) => {\n  return (\n    <button\n      className=\"animated-btn\"\n      onClick={onClick}\n    >\n      {children}\n    </button>\n  );\n};\n\nexport default AnimatedButton;",
-                            "animationCode": ".animated-btn {\n  background: linear-gradient(45deg, #667eea, #764ba2);\n  border: none;\n  padding: 12px 24px;\n  border-radius: 8px;\n  color: white;\n  cursor: pointer;\n  transition: all 0.3s ease;\n}\n\n.animated-btn:hover {\n  transform: translateY(-2px);\n  box-shadow: 0 4px 20px rgba(0,0,0,0.3);\n}"
-                        }, indent=2)
-                    },
-                    "url": {
-                        "raw": "{{base_url}}/api/components",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "components"]
-                    },
-                    "description": "Crea un nuevo componente (requiere autenticación)"
+            "response": []
+        },
+        {
+            "name": "Create Premium Upgrade Order",
+            "request": {
+                "auth": {
+                    "type": "noauth"
                 },
-                "response": []
-            },
-            {
-                "name": "Get Specific Component",
-                "request": {
-                    "auth": {
-                        "type": "noauth"
-                    },
-                    "method": "GET",
-                    "header": [
-                        {
-                            "key": "token",
-                            "value": "{{auth_token}}"
-                        }
-                    ],
-                    "url": {
-                        "raw": "{{base_url}}/api/components/custom-button-1",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "components", "custom-button-1"]
+                "method": "POST",
+                "header": [
+                    {
+                        "key": "Content-Type",
+                        "value": "application/json"
                     },
-                    "description": "Obtiene detalles completos de un componente específico (requiere autenticación y posible pago)"
+                    {
+                        "key": "token",
+                        "value": "{{auth_token}}"
+                    }
+                ],
+                "body": {
+                    "mode": "raw",
+                    "raw": _PREMIUM_BODY
                 },
-                "response": []
+                "url": _url("api", "payment", "create-order"),
+                "description": "Crea una orden de PayPal para upgrade a premium"
             },
-            {
-                "name": "Get User Access Info",
-                "request": {
-                    "auth": {
-                        "type": "noauth"
-                    },
-                    "method": "GET",
-                    "header": [
+            "response": []
+        },
+        {
+            "name": "Capture Order (Webhook)",
+            "request": {
+                "method": "GET",
+                "header": [],
+                "url": {
+                    "raw": "{{base_url}}/api/payment/capture-order?token=PAYPAL_TOKEN&componentId=custom-button-1&userId=USER_ID&amount=25.50&isPremiumUpgrade=false",
+                    "host": ["{{base_url}}"],
+                    "path": ["api", "payment", "capture-order"],
+                    "query": [
                         {
                             "key": "token",
-                            "value": "{{auth_token}}"
-                        }
-                    ],
-                    "url": {
-                        "raw": "{{base_url}}/api/components/user/access-info",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "components", "user", "access-info"]
-                    },
-                    "description": "Obtiene información sobre el acceso del usuario a componentes"
-                },
-                "response": []
-            }
-        ]
-    }
-
-def create_payments_folder():
-    """Crea la carpeta de pagos"""
-    return {
-        "name": "💳 Payments",
-        "item": [
-            {
-                "name": "Get Pricing Info",
-                "request": {
-                    "method": "GET",
-                    "header": [],
-                    "url": {
-                        "raw": "{{base_url}}/api/payment/pricing-info",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "payment", "pricing-info"]
-                    },
-                    "description": "Obtiene información de precios y beneficios premium"
-                },
-                "response": []
-            },
-            {
-                "name": "Create Component Donation Order",
-                "request": {
-                    "auth": {
-                        "type": "noauth"
-                    },
-                    "method": "POST",
-                    "header": [
+                            "value": "PAYPAL_TOKEN",
+                            "description": "Token de PayPal después de la aprobación"
+                        },
                         {
-                            "key": "Content-Type",
-                            "value": "application/json"
+                            "key": "componentId",
+                            "value": "custom-button-1",
+                            "description": "ID del componente (opcional para premium)"
                         },
                         {
-                            "key": "token",
-                            "value": "{{auth_token}}"
-                        }
-                    ],
-                    "body": {
-                        "mode": "raw",
-                        "raw": json.dumps({
-                            "amount": 25.50,
-                            "componentId": "custom-button-1",
-                            "isPremiumUpgrade": False
-                        }, indent=2)
-                    },
-                    "url": {
-                        "raw": "{{base_url}}/api/payment/create-order",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "payment", "create-order"]
-                    },
-                    "description": "Crea una orden de PayPal para donar por un componente específico"
-                },
-                "response": []
-            },
-            {
-                "name": "Create Premium Upgrade Order",
-                "request": {
-                    "auth": {
-                        "type": "noauth"
-                    },
-                    "method": "POST",
-                    "header": [
+                            "key": "userId",
+                            "value": "USER_ID",
+                            "description": "ID del usuario"
+                        },
                         {
-                            "key": "Content-Type",
-                            "value": "application/json"
+                            "key": "amount",
+                            "value": "25.50",
+                            "description": "Cantidad en MXN"
                         },
                         {
-                            "key": "token",
-                            "value": "{{auth_token}}"
+                            "key": "isPremiumUpgrade",
+                            "value": "false",
+                            "description": "Si es upgrade premium"
                         }
-                    ],
-                    "body": {
-                        "mode": "raw",
-                        "raw": json.dumps({
-                            "amount": 50.00,
-                            "isPremiumUpgrade": True
-                        }, indent=2)
-                    },
-                    "url": {
-                        "raw": "{{base_url}}/api/payment/create-order",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "payment", "create-order"]
-                    },
-                    "description": "Crea una orden de PayPal para upgrade a premium"
+                    ]
                 },
-                "response": []
+                "description": "Endpoint llamado por PayPal después de la aprobación del pago"
             },
-            {
-                "name": "Capture Order (Webhook)",
-                "request": {
-                    "method": "GET",
-                    "header": [],
-                    "url": {
-                        "raw": "{{base_url}}/api/payment/capture-order?token=PAYPAL_TOKEN&componentId=custom-button-1&userId=USER_ID&amount=25.50&isPremiumUpgrade=false",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "payment", "capture-order"],
-                        "query": [
-                            {
-                                "key": "token",
-                                "value": "PAYPAL_TOKEN",
-                                "description": "Token de PayPal después de la aprobación"
-                            },
-                            {
-                                "key": "componentId",
-                                "value": "custom-button-1",
-                                "description": "ID del componente (opcional para premium)"
-                            },
-                            {
-                                "key": "userId",
-                                "value": "USER_ID",
-                                "description": "ID del usuario"
-                            },
-                            {
-                                "key": "amount",
-                                "value": "25.50",
-                                "description": "Cantidad en MXN"
-                            },
-                            {
-                                "key": "isPremiumUpgrade",
-                                "value": "false",
-                                "description": "Si es upgrade premium"
-                            }
-                        ]
-                    },
-                    "description": "Endpoint llamado por PayPal después de la aprobación del pago"
-                },
-                "response": []
+            "response": []
+        },
+        {
+            "name": "Cancel Order (Webhook)",
+            "request": {
+                "method": "GET",
+                "header": [],
+                "url": _url("api", "payment", "cancel-order"),
+                "description": "Endpoint llamado cuando el usuario cancela el pago en PayPal"
             },
-            {
-                "name": "Cancel Order (Webhook)",
-                "request": {
-                    "method": "GET",
-                    "header": [],
-                    "url": {
-                        "raw": "{{base_url}}/api/payment/cancel-order",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "payment", "cancel-order"]
-                    },
-                    "description": "Endpoint llamado cuando el usuario cancela el pago en PayPal"
-                },
-                "response": []
-            }
-        ]
-    }
+            "response": []
+        }
+    ]
+}
 
-def create_utility_folder():
-    """Crea la carpeta de utilidades y testing"""
-    return {
-        "name": "🛠️ Utilities & Testing",
-        "item": [
-            {
-                "name": "API Documentation",
-                "request": {
-                    "method": "GET",
-                    "header": [],
-                    "url": {
-                        "raw": "{{base_url}}/api-docs",
-                        "host": ["{{base_url}}"],
-                        "path": ["api-docs"]
-                    },
-                    "description": "Accede a la documentación Swagger de la API"
-                },
-                "response": []
+def create_payments_folder():
+    """Crea la carpeta de pagos"""
+    return _PAYMENTS_FOLDER
+
+_UTILITY_FOLDER = {
+    "name": "🛠️ Utilities & Testing",
+    "item": [
+        {
+            "name": "API Documentation",
+            "request": {
+                "method": "GET",
+                "header": [],
+                "url": _url("api-docs"),
+                "description": "Accede a la documentación Swagger de la API"
             },
-            {
-                "name": "Health Check",
-                "request": {
-                    "method": "GET",
-                    "header": [],
-                    "url": {
-                        "raw": "{{base_url}}/",
-                        "host": ["{{base_url}}"],
-                        "path": [""]
-                    },
-                    "description": "Verifica que el servidor esté funcionando"
-                },
-                "response": []
+            "response": []
+        },
+        {
+            "name": "Health Check",
+            "request": {
+                "method": "GET",
+                "header": [],
+                "url": _url(""),
+                "description": "Verifica que el servidor esté funcionando"
             },
-            {
-                "name": "Test Flow - Complete User Journey",
-                "request": {
-                    "method": "GET",
-                    "header": [],
-                    "url": {
-                        "raw": "{{base_url}}/api/components",
-                        "host": ["{{base_url}}"],
-                        "path": ["api", "components"]
-                    },
-                    "description": "Endpoint base para testing de flujo completo"
-                },
-                "response": [],
-                "event": [
-                    {
-                        "listen": "prerequest",
-                        "script": {
-                            "exec": [
-                                "// Test Flow Script",
-                                "console.log('=== COMPLETE USER JOURNEY TEST ===');",
-                                "console.log('1. Register user');",
-                                "console.log('2. Login user');", 
-                                "console.log('3. Get components');",
-                                "console.log('4. Try to access premium component');",
-                                "console.log('5. Create payment order');",
-                                "console.log('6. Check user access after payment');",
-                                "console.log('=====================================');"
-                            ]
-                        }
+            "response": []
+        },
+        {
+            "name": "Test Flow - Complete User Journey",
+            "request": {
+                "method": "GET",
+                "header": [],
+                "url": _url("api", "components"),
+                "description": "Endpoint base para testing de flujo completo"
+            },
+            "response": [],
+            "event": [
+                {
+                    "listen": "prerequest",
+                    "script": {
+                        "exec": [
+                            "// Test Flow Script",
+                            "console.log('=== COMPLETE USER JOURNEY TEST ===');",
+                            "console.log('1. Register user');",
+                            "console.log('2. Login user');", 
+                            "console.log('3. Get components');",
+                            "console.log('4. Try to access premium component');",
+                            "console.log('5. Create payment order');",
+                            "console.log('6. Check user access after payment');",
+                            "console.log('=====================================');"
+                        ]
                     }
-                ]
-            }
-        ]
-    }
+                }
+            ]
+        }
+    ]
+}
+
+def create_utility_folder():
+    """Crea la carpeta de utilidades y testing"""
+    return _UTILITY_FOLDER
 
 def create_test_environments():
     """Crea entornos de prueba para la colección"""
@@ -550,10 +555,7 @@ def create_test_environments():
     
     return environments
 
-def generate_readme():
-    """Genera un README con instrucciones de uso"""
-    
-    readme_content = """
+README_CONTENT = """
 # Component Store API - Postman Collection
 
 Esta colección de Postman contiene todas las requests necesarias para probar y documentar la API del Component Store.
@@ -667,8 +669,21 @@ Usa Postman Monitor para:
 
 **¿Necesitas ayuda?** Consulta la documentación Swagger en `/api-docs`
 """
-    
-    return readme_content
+
+README_BYTES = README_CONTENT.encode('utf-8')
+
+def generate_readme():
+    """Genera un README con instrucciones de uso"""
+    return README_CONTENT
+
+def _write_one(job):
+    """Escribe un archivo de salida; job es una tupla (ruta, datos en bytes)"""
+    filename, data = job
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
 def main():
     """Función principal que genera todos los archivos"""
@@ -681,32 +696,32 @@ def main():
     # Generar entornos
     environments = create_test_environments()
     
-    # Generar README
-    readme = generate_readme()
-    
-    # Guardar archivos
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Archivo de colección
+    # Guardar archivos (sello de tiempo sin pasar por strftime/locale)
+    n = datetime.now()
+    timestamp = f"{n.year:04d}{n.month:02d}{n.day:02d}_{n.hour:02d}{n.minute:02d}{n.second:02d}"
+
+    # Serializar en el hilo principal y escribir todos los archivos en paralelo
     collection_filename = f"component-store-api_{timestamp}.postman_collection.json"
-    with open(collection_filename, 'w', encoding='utf-8') as f:
-        json.dump(collection, f, indent=2, ensure_ascii=False)
-    
-    # Archivos de entornos
-    for env_name, env_data in environments.items():
-        env_filename = f"component-store-{env_name}_{timestamp}.postman_environment.json"
-        with open(env_filename, 'w', encoding='utf-8') as f:
-            json.dump(env_data, f, indent=2, ensure_ascii=False)
-    
-    # Archivo README
     readme_filename = f"POSTMAN_README_{timestamp}.md"
-    with open(readme_filename, 'w', encoding='utf-8') as f:
-        f.write(readme)
-    
+    env_filenames = {
+        env_name: f"component-store-{env_name}_{timestamp}.postman_environment.json"
+        for env_name in environments
+    }
+    jobs = [
+        (collection_filename, _dump_bytes(collection, indent=True)),
+        (readme_filename, README_BYTES)
+    ]
+    jobs.extend(
+        (env_filenames[env_name], _dump_bytes(env_data, indent=True))
+        for env_name, env_data in environments.items()
+    )
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        list(executor.map(_write_one, jobs))
+
     print(f"✅ Archivos generados exitosamente:")
     print(f"   📄 Colección: {collection_filename}")
-    print(f"   🌍 Entorno Development: component-store-development_{timestamp}.postman_environment.json")
-    print(f"   🌍 Entorno Production: component-store-production_{timestamp}.postman_environment.json")
+    print(f"   🌍 Entorno Development: {env_filenames['development']}")
+    print(f"   🌍 Entorno Production: {env_filenames['production']}")
     print(f"   📖 README: {readme_filename}")
     print()
     print("📥 **Instrucciones de importación:**")